@@ -1,6 +1,13 @@
+import contextlib
+import os
+import re
+import threading
+from pathlib import Path
+
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import pyarrow as pa
 import plotly.graph_objects as go
 
 # Set page configuration
@@ -9,278 +16,359 @@ st.set_page_config(page_title="University Dashboard", layout="wide")
 st.title("University Dashboard")
 
 # --- Data Loading & Preparation ---
-@st.cache_data
-def load_data():
-    df = pd.read_csv("university_student_dashboard_data.csv")
+DATA_PATH = Path("university_student_dashboard_data.csv")
+# Must be bumped whenever parse_csv, CSV_DTYPES or SEASONS change. st.cache_data hashes
+# only load_data's own source, so this version is what keeps snapshots and disk-cached
+# loads written by older parsing code from being served.
+SNAPSHOT_VERSION = 3
+# Processed snapshot written next to the CSV; keeps the derived Season column and dtypes
+SNAPSHOT_PATH = DATA_PATH.with_name(f"{DATA_PATH.stem}.v{SNAPSHOT_VERSION}.parquet")
+
+# Explicit column types skip read_csv's inference pass and keep the frame compact
+CSV_DTYPES = {
+    "Year": "int16",
+    "Term": "category",
+    "Applications": "int32",
+    "Admitted": "int32",
+    "Enrolled": "int32",
+    "Retention Rate (%)": "float32",
+    "Student Satisfaction (%)": "float32",
+    "Arts Enrolled": "int32",
+    "Science Enrolled": "int32",
+    "Engineering Enrolled": "int32",
+    "Business Enrolled": "int32",
+}
+
+# Fixed Season categories, so every load shares the same codes
+SEASONS = ["Spring", "Fall", "Other"]
+
+def academic_order(term):
+    # Year first when the label carries one (e.g. "Fall 2020"), then Spring before Fall
+    parts = term.split()
+    year = int(parts[-1]) if parts and parts[-1].isdigit() else 0
+    season = 0 if "Spring" in term else (1 if "Fall" in term else 2)
+    return year, season, term
+
+def parse_csv():
+    # Only the columns the dashboard uses are parsed; the header probe keeps optional ones optional
+    header = pd.read_csv(DATA_PATH, nrows=0).columns
+    usecols = [column for column in CSV_DTYPES if column in header]
+    df = pd.read_csv(DATA_PATH, engine="pyarrow", usecols=usecols, dtype=CSV_DTYPES)
     # Expected columns include: "Term", "Applications", "Admitted", "Enrolled",
     # "Retention Rate (%)", "Student Satisfaction (%)", "Arts Enrolled", "Science Enrolled",
     # "Engineering Enrolled", "Business Enrolled"
-    df['Season'] = df['Term'].apply(lambda x: 'Spring' if 'Spring' in x else ('Fall' if 'Fall' in x else 'Other'))
+    # Categorical keys let groupby and filtering work on integer codes
+    terms = sorted(df['Term'].cat.categories, key=academic_order)
+    df['Term'] = pd.Categorical(df['Term'], categories=terms, ordered=True)
+    # Season is classified once per Term category and broadcast to the rows through the codes
+    labels = np.asarray(terms, dtype=str)
+    seasons = np.select(
+        [np.char.find(labels, 'Spring') >= 0, np.char.find(labels, 'Fall') >= 0],
+        ['Spring', 'Fall'],
+        default='Other'
+    )
+    # A missing Term has code -1, which picks this trailing 'Other' entry
+    seasons = np.append(seasons, 'Other')
+    df['Season'] = pd.Categorical(seasons[df['Term'].cat.codes.to_numpy()], categories=SEASONS)
+
+    # Write beside the snapshot and rename over it, so readers never see a partial file
+    tmp = SNAPSHOT_PATH.with_name(f"{SNAPSHOT_PATH.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        df.to_parquet(tmp, engine="pyarrow", compression="zstd")
+        os.replace(tmp, SNAPSHOT_PATH)
+    except OSError:
+        # Read-only deployments simply parse the CSV on each cold start
+        with contextlib.suppress(OSError):
+            tmp.unlink(missing_ok=True)
     return df
 
-df = load_data()
+# The CSV mtime and snapshot version are part of the cache key, so the disk
+# cache never outlives a data update or a change to parse_csv
+@st.cache_data(persist="disk", show_spinner="Loading dataset…")
+def load_data(csv_mtime, snapshot_version):
+    # Reuse the snapshot while it is at least as new as the CSV
+    if SNAPSHOT_PATH.exists() and SNAPSHOT_PATH.stat().st_mtime >= DATA_PATH.stat().st_mtime:
+        try:
+            return pd.read_parquet(SNAPSHOT_PATH)
+        except (OSError, ValueError, pa.ArrowException):
+            # A damaged snapshot is dropped and rebuilt from the CSV
+            with contextlib.suppress(OSError):
+                SNAPSHOT_PATH.unlink(missing_ok=True)
+    return parse_csv()
+
+# Static "Key Findings" text, one section per <!-- insight: name --> marker
+INSIGHTS_PATH = Path("insights.md")
+
+@st.cache_data(show_spinner=False)
+def load_insights():
+    parts = re.split(r"^<!-- insight: (\w+) -->$", INSIGHTS_PATH.read_text(encoding="utf-8"), flags=re.M)
+    return {name: text.strip() for name, text in zip(parts[1::2], parts[2::2])}
+
+# Enrollment columns for each department
+dept_columns = ["Arts Enrolled", "Science Enrolled", "Engineering Enrolled", "Business Enrolled"]
+# Columns read by the summary KPIs
+KPI_COLUMNS = ["Applications", "Admitted", "Enrolled", "Retention Rate (%)", "Student Satisfaction (%)"]
+
+# load_data hands out a fresh copy on every call, so the frame is shared read-only
+# through cache_resource and load_data is only hit once per data file
+@st.cache_resource(show_spinner=False)
+def shared_data(csv_mtime, snapshot_version):
+    return load_data(csv_mtime, snapshot_version)
+
+def get_data(csv_mtime):
+    return shared_data(csv_mtime, SNAPSHOT_VERSION)
+
+def get_term_options(csv_mtime):
+    # The ordered categories are already in academic order
+    return ["All"] + get_data(csv_mtime)['Term'].cat.categories.tolist()
+
+def filter_by_term(csv_mtime, term):
+    # Callers only read the result, so no copy is needed
+    df = get_data(csv_mtime)
+    return df if term == "All" else df.loc[df["Term"].values == term]
+
+def plot_ready(df):
+    # Round float series to two decimals before they are serialized into figure JSON;
+    # float32 columns are widened first, or 85.33 would come out as 85.33000183...
+    floats = df.select_dtypes("float").columns
+    return df.astype({column: "float64" for column in floats}).round(2)
+
+# --- Cached Derivations ---
+# Keyed on the CSV mtime and the selected term string, so a rerun for a term
+# that has been seen before skips the pandas work entirely, while an edited
+# data file gets fresh results.
+@st.cache_data(show_spinner=False)
+def term_summary(csv_mtime, term):
+    # One aggregation of the filtered rows per term; the per-term charts and
+    # the department totals are all sliced from this small table. Grouping
+    # sorts by the ordered Term categorical, so rows come out in academic
+    # order (Spring before Fall in each year) whatever order the CSV uses.
+    return filter_by_term(csv_mtime, term).groupby("Term", observed=True).agg(
+        Season=("Season", "first"),
+        Applications=("Applications", "sum"),
+        Admitted=("Admitted", "sum"),
+        Enrolled=("Enrolled", "sum"),
+        Retention=("Retention Rate (%)", "mean"),
+        Satisfaction=("Student Satisfaction (%)", "mean"),
+        **{column: (column, "sum") for column in dept_columns}
+    ).reset_index()
+
+@st.cache_data(show_spinner=False)
+def compute_kpis(csv_mtime, term):
+    filtered_df = filter_by_term(csv_mtime, term)
+    # KPIs reduce plain NumPy arrays, skipping pandas dispatch
+    arrays = {column: filtered_df[column].to_numpy() for column in KPI_COLUMNS if column in filtered_df.columns}
+
+    # Use the "Enrollments" column if available; otherwise compute from departmental columns
+    if "Enrolled" in arrays:
+        total_enrollments = arrays["Enrolled"].sum()
+    else:
+        total_enrollments = filtered_df[dept_columns].to_numpy().sum()
+    return {
+        "total_applications": int(arrays["Applications"].sum()),
+        "total_admissions": int(arrays["Admitted"].sum()),
+        "total_enrollments": int(total_enrollments),
+        "avg_retention": float(arrays["Retention Rate (%)"].mean(dtype=np.float64)),
+        "avg_satisfaction": float(arrays["Student Satisfaction (%)"].mean(dtype=np.float64)),
+    }
+
+# --- Views ---
+# Plain helpers over the aggregations above (or, for the yearly tables, one
+# groupby of the shared frame). Only the figure builders read them, and those
+# are cached, so another cache entry here would just store a second copy.
+def dept_totals(csv_mtime, term):
+    return term_summary(csv_mtime, term)[dept_columns].to_numpy().sum(axis=0)
+
+def admissions_by_term(csv_mtime, term):
+    # Admissions funnel totals per term
+    return term_summary(csv_mtime, term)[["Term", "Applications", "Admitted", "Enrolled"]]
+
+def season_tables(csv_mtime, term):
+    # Per-term funnel and satisfaction metrics, labelled by season (Spring/Fall only)
+    season_metrics = term_summary(csv_mtime, term)[
+        ["Season", "Term", "Applications", "Admitted", "Enrolled", "Retention", "Satisfaction"]
+    ]
+    return season_metrics[season_metrics["Season"] != "Other"].reset_index(drop=True)
+
+def dept_breakdown(csv_mtime, term):
+    return pd.DataFrame({
+        "Department": ["Arts", "Science", "Engineering", "Business"],
+        "Enrollments": dept_totals(csv_mtime, term)
+    })
+
+def dept_by_term(csv_mtime, term):
+    # One row of department totals per term rather than one per CSV row
+    return term_summary(csv_mtime, term)[["Term", *dept_columns]]
+
+def yearly_trends(csv_mtime):
+    # One point per year for the trend charts instead of one per term
+    return plot_ready(get_data(csv_mtime).groupby("Year", as_index=False)[
+        ["Retention Rate (%)", "Student Satisfaction (%)"]
+    ].mean())
+
+def dept_by_year(csv_mtime):
+    # Per-year department means; the figure reads the wide table, so nothing is melted
+    return plot_ready(get_data(csv_mtime).groupby("Year", as_index=False)[dept_columns].mean())
+
+# --- Figure Builders ---
+# Figures are cached per data file and term selection (or per data file, for
+# the unfiltered charts).
+# Each builder pulls its own cached data, so a cache hit skips both the
+# DataFrame lookup and the plotly.express pipeline.
+@st.cache_resource(show_spinner=False)
+def build_admissions_fig(csv_mtime, term):
+    # Grouped bars are built trace by trace from the wide table, skipping plotly.express
+    term_metrics = admissions_by_term(csv_mtime, term)
+    fig = go.Figure([
+        go.Bar(name=column, x=term_metrics["Term"], y=term_metrics[column])
+        for column in ["Applications", "Admitted", "Enrolled"]
+    ])
+    fig.update_layout(barmode="group", title="Applications, Admissions, and Enrollments per Term",
+                      xaxis_title="Term", yaxis_title="Count", legend_title_text="Metric",
+                      xaxis_tickangle=-45, uirevision="static")
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def build_retention_fig(csv_mtime):
+    # Connect data points with lines (groupby returns the years in order)
+    trends = yearly_trends(csv_mtime)
+    fig = go.Figure(go.Scattergl(x=trends["Year"], y=trends["Retention Rate (%)"], mode="lines+markers"))
+    fig.update_layout(title="Retention Rate Trends Over Time", xaxis_title="Year",
+                      yaxis_title="Retention Rate (%)", xaxis_tickangle=-45, uirevision="static")
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def build_satisfaction_fig(csv_mtime):
+    trends = yearly_trends(csv_mtime)
+    fig = go.Figure(go.Scattergl(x=trends["Year"], y=trends["Student Satisfaction (%)"], mode="lines+markers"))
+    fig.update_layout(title="Student Satisfaction over the years", xaxis_title="Year",
+                      yaxis_title="Student Satisfaction (%)", xaxis_tickangle=-45, uirevision="static")
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def build_enrollment_dept_fig(csv_mtime, term):
+    breakdown = dept_breakdown(csv_mtime, term)
+    fig = go.Figure(go.Pie(labels=breakdown["Department"], values=breakdown["Enrollments"]))
+    fig.update_layout(title="Enrollment Breakdown by Department", uirevision="static")
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def build_spring_fall_fig(csv_mtime, term):
+    season_metrics = season_tables(csv_mtime, term)
+    if season_metrics.empty:
+        return None
+    fig = go.Figure([
+        go.Bar(name=season, x=rows["Term"], y=rows["Enrolled"])
+        for season, rows in season_metrics.groupby("Season", sort=False, observed=True)
+    ])
+    fig.update_layout(barmode="group", title="Enrollments Comparison: Spring vs Fall",
+                      xaxis_title="Term", yaxis_title="Enrolled", legend_title_text="Season",
+                      xaxis_tickangle=-45, uirevision="static")
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def build_dept_trends_fig(csv_mtime, term):
+    # One bar trace per department, read straight from the per-term totals
+    totals = dept_by_term(csv_mtime, term)
+    fig = go.Figure([
+        go.Bar(name=column, x=totals["Term"], y=totals[column])
+        for column in dept_columns
+    ])
+    fig.update_layout(barmode="group", title="Departmental Enrollment Trends Over Terms",
+                      xaxis_title="Term", yaxis_title="Enrollments", legend_title_text="Department",
+                      xaxis_tickangle=-45, uirevision="static")
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def build_dept_trend_years_fig(csv_mtime):
+    # One line per department, read straight from the wide per-year table
+    yearly = dept_by_year(csv_mtime)
+    fig = go.Figure([
+        go.Scattergl(name=column, x=yearly["Year"], y=yearly[column], mode="lines+markers")
+        for column in dept_columns
+    ])
+    fig.update_layout(title="Departmental Enrollment Trends Over Years", xaxis_title="Year",
+                      yaxis_title="Enrollments", legend_title_text="Department",
+                      xaxis_tickangle=-45, uirevision="static")
+    return fig
 
 # --- Sidebar Filters ---
 st.sidebar.header("Filters")
 
 # Only Term filter is needed since department info comes from individual columns
-term_options = ['All'] + sorted(df['Term'].unique().tolist())
+# The data file's mtime keys every cached derivation, so an edited CSV is picked up on the next rerun
+csv_mtime = DATA_PATH.stat().st_mtime
+term_options = get_term_options(csv_mtime)
 selected_term = st.sidebar.selectbox("Select Term", term_options)
 
-# Apply term filter
-filtered_df = df.copy()
-if selected_term != "All":
-    filtered_df = filtered_df[filtered_df["Term"] == selected_term]
+insights = load_insights()
 
 # --- Summary KPIs ---
-total_applications = filtered_df["Applications"].sum()
-total_admissions = filtered_df["Admitted"].sum()
-# Use the "Enrollments" column if available; otherwise compute from departmental columns
-total_enrollments = filtered_df["Enrolled"].sum() if "Enrolled" in filtered_df.columns else (
-    filtered_df["Arts Enrolled"].sum() +
-    filtered_df["Science Enrolled"].sum() +
-    filtered_df["Engineering Enrolled"].sum() +
-    filtered_df["Business Enrolled"].sum()
-)
-avg_retention = filtered_df["Retention Rate (%)"].mean()
-avg_satisfaction = filtered_df["Student Satisfaction (%)"].mean()
+kpis = compute_kpis(csv_mtime, selected_term)
 
 st.subheader("Summary Metrics")
-st.markdown(f"**Total Applications:** {total_applications:,}")
-st.markdown(f"**Total Admitted:** {total_admissions:,}")
-st.markdown(f"**Total Enrolled:** {total_enrollments:,}")
-st.markdown(f"**Average Retention Rate (%):** {avg_retention:.2f}%")
-st.markdown(f"**Average Student Satisfaction (%):** {avg_satisfaction:.2f}%")
+st.markdown(f"**Total Applications:** {kpis['total_applications']:,}")
+st.markdown(f"**Total Admitted:** {kpis['total_admissions']:,}")
+st.markdown(f"**Total Enrolled:** {kpis['total_enrollments']:,}")
+st.markdown(f"**Average Retention Rate (%):** {kpis['avg_retention']:.2f}%")
+st.markdown(f"**Average Student Satisfaction (%):** {kpis['avg_satisfaction']:.2f}%")
 
 # --- Admissions Overview Panel ---
 st.subheader("Admissions Overview")
-admissions_data = filtered_df.groupby("Term").agg({
-    "Applications": "sum",
-    "Admitted": "sum",
-    "Enrolled": "sum"
-}).reset_index()
-
-fig_admissions = px.bar(admissions_data, x="Term", y=["Applications", "Admitted", "Enrolled"],
-                        barmode="group", title="Applications, Admissions, and Enrollments per Term")
-fig_admissions.update_layout(xaxis_tickangle=-45)
-st.plotly_chart(fig_admissions, use_container_width=True)
+fig_admissions = build_admissions_fig(csv_mtime, selected_term)
+st.plotly_chart(fig_admissions, use_container_width=True, key="admissions_fig")
 # --- Interactive Key Findings & Actionable Insights ---
 with st.expander("Click here to view Key Findings & Actionable Insights for Admissions Funnel Efficiency"):
-    st.markdown("""
-    **Admissions Funnel Efficiency:**
-    
-    - **Finding:**
-      - The dashboard indicates a total of **59,400 applications**, **35,100 admissions**, and **13,980 enrollments**.
-      - This corresponds to a conversion rate of approximately **59%** from applications to admissions, but only around **40%** of admitted students actually enroll.
-      - The number of applications, admissions and enrollments each term per year is same according to the bar chart.  
-    
-    - **Actionable Insights:**
-      - **Enhanced Follow-Up:** Deploy personalized communication strategies—such as targeted emails, campus visits, or webinars—to encourage admitted students to convert to enrolled.
-      - **Financial Incentives:** Reevaluate and potentially expand scholarship and financial aid offerings to improve the enrollment yield.
-      - **Targeted Recruitment:** Analyze demographic and geographic data to identify segments with lower conversion rates, then tailor recruitment strategies to address those gaps.
-    """)
+    st.markdown(insights["admissions"])
 
 # --- Retention Rate Trends ---
 st.subheader("Retention Rate Trends")
-fig = px.scatter(
-    df, 
-    x="Year", 
-    y="Retention Rate (%)", 
-    title="Retention Rate Trends Over Time",
-    labels={"Retention_Rate": "Retention Rate (%)"}
-)
-# Connect data points with lines (this assumes the data is ordered by term)
-fig.update_traces(mode='lines+markers')
-fig.update_layout(xaxis_tickangle=-45)
-st.plotly_chart(fig, use_container_width=True)
+fig = build_retention_fig(csv_mtime)
+st.plotly_chart(fig, use_container_width=True, key="retention_fig")
 with st.expander("Click here to view Key Findings & Actionable Insights for Retention Rate Trends"):
-    st.markdown("""
-    **Retention Rate Trends:**
-    
-    - **Finding:**
-      - Retention rates have risen from around 85% in 2016 to approximately 90% by 2024, indicating steady progress over the observed period.
-      - However, there are noticeable fluctuations in retention rates across different terms, with some periods experiencing dips around 2019–2020 (falling back near 85%) that may signal challenges in student engagement or academic support.
-      - The retention rate climbs sharply from 2021 onward, suggesting that recent measures (e.g., improved student support or revised academic policies) have effectively helped more students persist in their studies.
-    - **Actionable Insights:**
-      - **Investigate Past Challenges:** Examine the conditions or policy changes around 2019–2020 to understand what caused the temporary drop in retention. Insights here can help prevent similar declines in the future.Introduce early warning systems and proactive academic advising during terms with lower retention to identify and support at-risk students.
-      - **Enhanced Support Services:** Boost tutoring, mentoring, and counseling services during challenging periods to help improve student retention.
-      - **Curriculum Review:** Analyze terms with significant retention dips to determine if curriculum changes or course delivery methods might be contributing factors, and consider appropriate adjustments.
-    """)
+    st.markdown(insights["retention"])
 
 # --- Student Satisfaction Trends ---
 st.subheader("Student Satisfaction Trends")
-fig_satisfaction = px.line(df, x="Year", y="Student Satisfaction (%)", markers=True,
-                           title="Student Satisfaction over the years")
-fig_satisfaction.update_layout(xaxis_tickangle=-45)
-st.plotly_chart(fig_satisfaction, use_container_width=True)
+fig_satisfaction = build_satisfaction_fig(csv_mtime)
+st.plotly_chart(fig_satisfaction, use_container_width=True, key="satisfaction_fig")
 with st.expander("Click here to view Key Findings & Actionable Insights for Student Satisfaction Trends"):
-    st.markdown("""
-    **Student Satisfaction Trends:**
-    
-    - **Finding:**
-      - Student satisfaction rose from around 78% in the mid-2010s to about 88% by 2024, reflecting a notable improvement in the overall student experience.  
-      - The chart shows a steady upward trend with minor fluctuations—there’s a small dip around 2020, suggesting that specific events (e.g., changes in campus operations, global factors) may have temporarily impacted satisfaction levels.
-      - From 2021 onward, the satisfaction rate climbs more sharply, indicating that recent initiatives (academic improvements, campus upgrades, or support services) have positively influenced student sentiment.
-    - **Actionable Insights:**
-      - **Investigate Factors Behind the Dip:** Analyze the context around the 2020 dip to determine any disruptions—such as pandemic-related transitions, shifts in course delivery, or campus closures—and develop strategies to mitigate similar impacts in the future. 
-      - **Enhance Support Services:** Consider bolstering student support services and campus facilities to address concerns raised in feedback.Identify the most successful interventions implemented after 2021—such as expanded mental health support, improved online learning resources, or enhanced student engagement activities—and maintain or scale them.
-      - **Continuous Improvement:** Establish a transparent feedback loop where student input is regularly reviewed and leads to visible changes, thereby boosting overall satisfaction.Demonstrating a strong trajectory of improvement can help attract prospective students.
-    """)
+    st.markdown(insights["satisfaction"])
 
 # --- Enrollment Breakdown by Department ---
 st.subheader("Enrollment Breakdown by Department")
-# Create a DataFrame for the four departments using their respective enrollment columns
-dept_data = pd.DataFrame({
-    "Department": ["Arts", "Science", "Engineering", "Business"],
-    "Enrollments": [
-        filtered_df["Arts Enrolled"].sum(),
-        filtered_df["Science Enrolled"].sum(),
-        filtered_df["Engineering Enrolled"].sum(),
-        filtered_df["Business Enrolled"].sum()
-    ]
-})
-fig_enrollment_dept = px.pie(dept_data, names="Department", values="Enrollments",
-                             title="Enrollment Breakdown by Department")
-st.plotly_chart(fig_enrollment_dept, use_container_width=True)
+fig_enrollment_dept = build_enrollment_dept_fig(csv_mtime, selected_term)
+st.plotly_chart(fig_enrollment_dept, use_container_width=True, key="enrollment_dept_fig")
 with st.expander("Click here to view Key Findings & Actionable Insights for Enrollment Breakdown by Department"):
-    st.markdown("""
-    **Enrollment Breakdown by Department:**
-    
-    - **Finding:**
-      - The pie chart shows that the **Engineering** department leads with approximately **35.5%** of total enrollments.
-      - **Business** follows with around **26.4%**, **Arts** with **21%**, and **Science** with **17.2%**.
-      - This disparity indicates that certain departments are significantly more attractive or better marketed compared to others.
-    
-    - **Actionable Insights:**
-      - **Targeted Recruitment:** Increase outreach and tailored marketing efforts for departments with lower enrollment (e.g., Science) to boost their appeal.
-      - **Program Enhancement:** Review and potentially update the curriculum or program offerings in under-enrolled departments to align more closely with student interests and industry demands.
-      - **Resource Allocation:** Consider adjusting resource distribution, such as faculty and facilities, to support growth in departments that are lagging behind.
-      - **Stakeholder Engagement:** Engage with current students, alumni, and industry partners to gain insights into what makes certain departments more popular and use this information to improve the offerings in less popular areas.
-    """)
+    st.markdown(insights["enrollment_dept"])
 
 # --- Spring vs Fall Term Comparison ---
 st.subheader("Spring vs Fall Term Comparison")
-spring_data = filtered_df[filtered_df["Season"] == "Spring"].groupby("Term").agg({
-    "Applications": "sum",
-    "Admitted": "sum",
-    "Enrolled": "sum",
-    "Retention Rate (%)": "mean",
-    "Student Satisfaction (%)": "mean"
-}).reset_index()
-
-fall_data = filtered_df[filtered_df["Season"] == "Fall"].groupby("Term").agg({
-    "Applications": "sum",
-    "Admitted": "sum",
-    "Enrolled": "sum",
-    "Retention Rate (%)": "mean",
-    "Student Satisfaction (%)": "mean"
-}).reset_index()
-
-if not spring_data.empty:
-    spring_data["Season"] = "Spring"
-if not fall_data.empty:
-    fall_data["Season"] = "Fall"
-
-if not spring_data.empty or not fall_data.empty:
-    combined = pd.concat([spring_data, fall_data])
-    fig_spring_fall = px.bar(combined, x="Term", y="Enrolled", color="Season",
-                             barmode="group", title="Enrollments Comparison: Spring vs Fall")
-    fig_spring_fall.update_layout(xaxis_tickangle=-45)
-    st.plotly_chart(fig_spring_fall, use_container_width=True)
+fig_spring_fall = build_spring_fall_fig(csv_mtime, selected_term)
+if fig_spring_fall is not None:
+    st.plotly_chart(fig_spring_fall, use_container_width=True, key="spring_fall_fig")
 else:
     st.write("Insufficient data for Spring vs Fall comparison.")
 with st.expander("Click here to view Key Findings & Actionable Insights for Seasonal Variations – Spring vs. Fall"):
-    st.markdown("""
-    **Seasonal Variations – Spring vs. Fall:**
-    
-    - **Finding:**
-      - The data shows that both **Fall and **Spring terms consistently have the same enrollment numbers**.
-      
-    - **Actionable Insights:**
-      - **Resource Allocation:** Allocate more resources, such as faculty and support services, during both terms to manage the higher demand.
-      - **Term Recruitment Strategies:** Develop targeted marketing and recruitment initiatives for both terms, such as early admission incentives, flexible course schedules, or tailored program offerings.
-      - **Trend Monitoring:** Continuously monitor seasonal enrollment trends to quickly adapt strategies and address any emerging discrepancies.
-      - **Program Diversification:** Consider expanding or diversifying programs during both terms to increase its appeal and boost enrollment numbers.
-    """)
+    st.markdown(insights["spring_fall"])
 
 # --- Compare Trends Between Departments ---
 st.subheader("Departmental Enrollment Trends Over Terms")
 
-# Define the enrollment columns for each department
-dept_columns = ["Arts Enrolled", "Science Enrolled", "Engineering Enrolled", "Business Enrolled"]
-
-# Convert the wide-format departmental columns into a long-format DataFrame
-df_dept_long = filtered_df.melt(
-    id_vars=["Term", "Year"],
-    value_vars=dept_columns,
-    var_name="Department",
-    value_name="Enrollments"
-)
-
 # Create a line chart comparing trends between departments
-fig_dept_trends = px.bar(
-    df_dept_long,
-    x="Term",
-    y="Enrollments",
-    color="Department",
-    barmode="group",
-    title="Departmental Enrollment Trends Over Terms"
-)
-fig_dept_trends.update_layout(xaxis_tickangle=-45)
-
-st.plotly_chart(fig_dept_trends, use_container_width=True)
+fig_dept_trends = build_dept_trends_fig(csv_mtime, selected_term)
+
+st.plotly_chart(fig_dept_trends, use_container_width=True, key="dept_trends_fig")
 with st.expander("Click here to view Key Findings & Actionable Insights for Departmental Trends Over Terms"):
-    st.markdown("""
-    **Departmental Trends Over Time:**
-    
-    - **Finding:**
-      - Enrollment patterns remain consistent between Spring and Fall, meaning students are not showing a strong preference for one term over the other in terms of department choices.
-      - Some departments, such as Engineering and Business, display consistent or growing trends, while others like Arts and Science may show stagnation or declines in specific terms.
-      - These variations suggest shifting student interests and possibly different levels of resource allocation or program appeal.
-    
-    - **Actionable Insights:**
-      - **Data-Driven Strategy:** Use these trend insights to plan for future growth by investing in departments showing upward trends and re-evaluating programs in those with declining performance.
-      - **Targeted Interventions:** For departments experiencing downturns, consider initiatives such as curriculum updates, enhanced marketing campaigns, or new industry partnerships to revitalize interest.
-      - **Resource Optimization:** Adjust faculty and resource allocation based on long-term trends to support departments that are expanding.
-      - **Stakeholder Engagement:** Collaborate with faculty, students, and industry experts to identify and address factors influencing these trends, ensuring that program offerings remain relevant and competitive.
-    """)
+    st.markdown(insights["dept_trends"])
 
 # --- Compare Departmental Enrollment Trends Over Multiple Years ---
 st.subheader("Departmental Enrollment Trends Over Multiple Years")
 
-# Convert department enrollment data into long format for trend analysis
-df_dept_trends = df.melt(
-    id_vars=["Year"],
-    value_vars=["Arts Enrolled", "Science Enrolled", "Engineering Enrolled", "Business Enrolled"],
-    var_name="Department",
-    value_name="Enrollments"
-)
-
 # Create a line chart showing department enrollment trends over years
-fig_dept_trend_years = px.line(
-    df_dept_trends,
-    x="Year",
-    y="Enrollments",
-    color="Department",
-    markers=True,
-    title="Departmental Enrollment Trends Over Years"
-)
-fig_dept_trend_years.update_layout(xaxis_tickangle=-45)
-st.plotly_chart(fig_dept_trend_years, use_container_width=True)
+fig_dept_trend_years = build_dept_trend_years_fig(csv_mtime)
+st.plotly_chart(fig_dept_trend_years, use_container_width=True, key="dept_trend_years_fig")
 
 # --- Interactive Key Findings & Actionable Insights ---
 with st.expander("Click here to view Key Findings & Actionable Insights on Student Trends Over Years"):
-    st.markdown("""
-**Trends in Departmental Enrollment Over the Years:**
-
-- **Finding:**
--**Engineering Enrollment Shows Consistent Growth:** Engineering has experienced steady growth, rising from just above 200 enrollments in 2015 to nearly 300 by 2024.This suggests strong demand and sustained student interest in the field.
--**Business Enrollment is Growing but at a Slower Rate:** Business enrollment has been increasing but at a slower pace compared to Engineering.While it started near 150 enrollments in 2015, the growth trajectory suggests moderate but stable interest.
--**Arts Enrollment is Gradually Increasing:** The Arts department has shown steady but slower growth. The increase is noticeable, though it remains behind Engineering and Business in overall numbers.
--**Science Enrollment is Declining:**Unlike other departments, Science enrollments initially remained stable but started to decline from 2019 onward.By 2024, Science enrollment is at its lowest in the observed period, suggesting a potential drop in interest or external factors affecting student decisions.
-
-- **Actionable Insights:**
-- **Expand Engineering Programs to Sustain Growth:** Given consistent demand, consider increasing faculty, lab resources, and industry partnerships to support future growth. Develop specialized tracks (e.g., AI, Robotics, Renewable Energy) to attract an even broader student base.
-- **Enhance Business Offerings to Strengthen Growth:** While growing slowly, Business could benefit from more specialized programs such as Finance, Entrepreneurship, or Tech-Driven Business. Strengthen industry collaboration by offering internship-based programs and networking events.
-- **Support Science Programs to Reverse the Decline:** Investigate why enrollments are decreasing—this could be due to limited job prospects, outdated course structures, or competitive programs elsewhere. Consider modernizing the curriculum, introducing interdisciplinary programs (e.g., Data Science, Environmental Science), and enhancing lab/research opportunities.
-- **Continue Arts Program Promotion & Diversification:** Arts enrollment is increasing but remains below Engineering and Business.Consider launching cross-disciplinary programs that integrate Arts with Business or Technology (e.g., Digital Media, UX/UI Design, or Film & Entrepreneurship).Strengthen career-focused initiatives (e.g., internships, industry projects) to showcase real-world applications of an Arts degree.""")
+    st.markdown(insights["dept_trend_years"])